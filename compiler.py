@@ -1,26 +1,87 @@
-from sarac.core.rep.ast import *
+import argparse
+import mmap
+import sys
 
-from sarac.core.front.parser import Parser
-from sarac.core.visitors.symboltable import BuildSymbolTableVisitor, SymbolTablePrinterVisitor
-from sarac.core.visitors.optimizer import OptimizerVisitor
-from sarac.core.visitors.semantics import SemanticsVisitor
+from sarac.core import cache
+from sarac.core.error import Error
+from sarac.core.front.parser import get_parser
+from sarac.core.visitors.analysis import AnalysisVisitor
+from sarac.core.visitors.optimizer import OPTIMIZER_REV
 from sarac.core.visitors.printer import PrintASTVisitor
 
-t_count = 0
 
-with open('in.sra', 'r') as f:
-    parser = Parser()
-    program = parser.parse(f.read())
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Sarac, the Sara compiler')
+    parser.add_argument('source', nargs='?', default='in.sra', help='Sara source file')
+    parser.add_argument('--cache-dir', help='cache analyzed programs in this directory')
+    parser.add_argument('-O', dest='optimization_level', choices=['0', '1'], default='1',
+                        help='optimization level, -O0 disables AST optimization')
+    parser.add_argument('--dump-ast', action='store_true', help='print the parsed AST and stop before analysis')
+    return parser.parse_args()
 
-    if parser.error_count == 0:
-        printer = PrintASTVisitor()
-        program.accept_children(printer)
 
-        table = BuildSymbolTableVisitor()
-        program.accept(table)
+def read_source(path):
+    """
+    Maps the source file in memory, the lexer slices its lexemes straight from the mapping
+    :param path: str
+    :return: mmap or str for empty files, which cannot be mapped
+    """
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return f.read()
 
-        semantics = SemanticsVisitor()
-        program.accept_children(semantics)
 
-        ast_optimizer = OptimizerVisitor()
-        program.accept_children(ast_optimizer)
\ No newline at end of file
+def parse(source):
+    """
+    Parses the source and prints its AST
+    :param source: str or mmap
+    :return: Program or None on syntax errors
+    """
+    parser = get_parser()
+    program = parser.parse(source)
+
+    if parser.error_count != 0:
+        return None
+
+    printer = PrintASTVisitor()
+    program.accept_children(printer)
+    sys.stdout.write(printer.get_output())
+
+    return program
+
+
+def main():
+    args = parse_arguments()
+
+    source = read_source(args.source)
+
+    # Only the parsed tree is wanted, semantic errors are not reported in this mode
+    if args.dump_ast:
+        return parse(source)
+
+    if args.cache_dir is not None:
+        key = cache.cache_key(source, args.optimization_level, OPTIMIZER_REV)
+        program = cache.load(args.cache_dir, key)
+        if program is not None:
+            return program
+
+    errors = Error.errors
+    program = parse(source)
+    if program is None:
+        return None
+
+    # Builds the symbol table, checks the semantics and optimizes in a single traversal
+    analysis = AnalysisVisitor(args.optimization_level != '0')
+    program.accept(analysis)
+
+    # Only error-free programs are cached, hits would hide the diagnostics otherwise
+    if args.cache_dir is not None and Error.errors == errors:
+        cache.store(args.cache_dir, key, program)
+
+    return program
+
+
+if __name__ == '__main__':
+    main()
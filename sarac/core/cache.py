@@ -0,0 +1,61 @@
+import cPickle as pickle
+import hashlib
+import os
+import tempfile
+
+# Bump whenever the pickled representation (AST, attributes, types) changes
+CACHE_VERSION = 4
+
+
+def cache_key(source, *salts):
+    """
+    Computes the cache key of a source text
+    :param source: str
+    :param salts: extra strings mixed into the key
+    :return: str
+    """
+    digest = hashlib.sha1(source)
+    # Entries of other versions get other keys, they may not even unpickle with the current classes
+    digest.update(str(CACHE_VERSION))
+    for salt in salts:
+        digest.update(salt)
+    return digest.hexdigest()
+
+
+def cache_path(cache_dir, key):
+    return os.path.join(cache_dir, key + '.saracache')
+
+
+def load(cache_dir, key):
+    """
+    Loads a cached object, returning None on a miss or a stale entry
+    :param cache_dir: str
+    :param key: str
+    :return: object
+    """
+    try:
+        with open(cache_path(cache_dir, key), 'rb') as f:
+            version, obj = pickle.load(f)
+    except (IOError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+
+    if version != CACHE_VERSION:
+        return None
+    return obj
+
+
+def store(cache_dir, key, obj):
+    """
+    Atomically stores an object in the cache
+    :param cache_dir: str
+    :param key: str
+    :param obj: object
+    :return: None
+    """
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump((CACHE_VERSION, obj), f, pickle.HIGHEST_PROTOCOL)
+    os.rename(tmp_path, cache_path(cache_dir, key))
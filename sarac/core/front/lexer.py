@@ -1,8 +1,15 @@
 import ply.lex as lex
+from ply.lex import TOKEN
 from sarac.core.error import Error
 
+# Patterns of the function rules, attached with TOKEN so they survive python -OO, which strips docstrings
+IDENTIFIER = r"""_*[a-zA-Z][_a-zA-Z0-9]*"""
+NEWLINE = r"""\n+"""
+
 
 class Coord(object):
+    __slots__ = ('line', 'column')
+
     def __init__(self, line, column):
         self.line = line
         self.column = column
@@ -20,10 +27,12 @@ class Lexer(object):
         'float': 'FLOAT',
         'return': 'RETURN'
     }
+    max_keyword_length = max(len(keyword) for keyword in keywords)
 
     tokens = [
         'IDENTIFIER',
-        'NUMBER',
+        'INTEGER_CONSTANT',
+        'FLOAT_CONSTANT',
         'LT',
         'LE',
         'GT',
@@ -46,133 +55,77 @@ class Lexer(object):
         'ASSIGN',
     ] + keywords.values()
 
+    # PLY sorts string rules by decreasing regex length, so '<=' is tried before '<'
+    t_FLOAT_CONSTANT = r'[0-9]+\.[0-9]+'
+    t_INTEGER_CONSTANT = r'[0-9]+'
+    t_PLUS = r'\+'
+    t_MINUS = r'\-'
+    t_TIMES = r'\*'
+    t_DIV = r'\/'
+    t_LE = r'<='
+    t_LT = r'<'
+    t_GE = r'>='
+    t_GT = r'>'
+    t_EQUAL = r'=='
+    t_ASSIGN = r'='
+    t_NOT_EQUAL = r'!='
+    t_NOT = r'!'
+    t_LPAREN = r'\('
+    t_RPAREN = r'\)'
+    t_LBRACKET = r'\['
+    t_RBRACKET = r'\]'
+    t_LBRACE = r'\{'
+    t_RBRACE = r'\}'
+    t_COMMA = r','
+    t_SEMICOLON = r';'
+
     t_ignore = ' \t'
 
     def __init__(self):
         self.lexer = None
+        self.line_start = 0
+        self._keyword_type = self.keywords.get
 
     def build(self, **kwargs):
         self.lexer = lex.lex(module=self, **kwargs)
 
-    def token_column(self, t):
-        last_cr = t.lexer.lexdata.rfind('\n', 0, t.lexpos)
-        return t.lexpos - last_cr
-
-    def t_NUMBER(self, t):
-        r"""[0-9]+(\.[0-9]+)?"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_IDENTIFIER(self, t):
-        r"""_*[a-zA-Z][_a-zA-Z0-9]*"""
-        t.type = self.keywords.get(t.value, 'IDENTIFIER')
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_PLUS(self, t):
-        r"""\+"""
-        print t
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_MINUS(self, t):
-        r"""\-"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_TIMES(self, t):
-        r"""\*"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_DIV(self, t):
-        r"""\/"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_NOT(self, t):
-        r"""!"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_LT(self, t):
-        r"""<"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_LE(self, t):
-        r"""<="""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_GT(self, t):
-        r""">"""
-        t.value = (t.value, t.lineno, self.token_column(t))
+    def input(self, data):
+        """
+        Feeds the lexer, the offset where the current line starts is tracked as the newlines are lexed
+        :param data: str
+        :return: None
+        """
+        self.line_start = 0
+        self.lexer.lineno = 1
+        self.lexer.input(data)
+
+    def token(self):
+        """
+        Returns the next token, with the column where it starts
+        :return: LexToken or None at the end of the input
+        """
+        t = self.lexer.token()
+        if t is not None:
+            t.column = t.lexpos - self.line_start + 1  # token_column, inlined on the per-token path
         return t
 
-    def t_GE(self, t):
-        r""">="""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_ASSIGN(self, t):
-        r"""="""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_EQUAL(self, t):
-        r"""=="""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_NOT_EQUAL(self, t):
-        r"""!="""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_LPAREN(self, t):
-        r"""\("""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_RPAREN(self, t):
-        r"""\)"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_LBRACKET(self, t):
-        r"""\["""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_RBRACKET(self, t):
-        r"""\]"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_LBRACE(self, t):
-        r"""\{"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_RBRACE(self, t):
-        r"""\}"""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
-
-    def t_COMMA(self, t):
-        r""","""
-        t.value = (t.value, t.lineno, self.token_column(t))
-        return t
+    def token_column(self, t):
+        # Tokens are lexed left to right, so t is always on the line that starts at line_start
+        return t.lexpos - self.line_start + 1
 
-    def t_SEMICOLON(self, t):
-        r""";"""
-        t.value = (t.value, t.lineno, self.token_column(t))
+    @TOKEN(IDENTIFIER)
+    def t_IDENTIFIER(self, t):
+        # Interned, the symbol table's dicts then compare repeated names by identity
+        t.value = intern(t.value)
+        # Longer identifiers cannot be keywords and keep the rule's IDENTIFIER type
+        if len(t.value) <= self.max_keyword_length:
+            t.type = self._keyword_type(t.value, 'IDENTIFIER')
         return t
 
+    @TOKEN(NEWLINE)
     def t_NEWLINE(self, t):
-        r"""\n+"""
         t.lexer.lineno += len(t.value)
+        self.line_start = t.lexpos + len(t.value)
 
     def t_error(self, t):
         Error.lexical_error("unknown char '%c'" % t.value[0], t.lexer.lineno, self.token_column(t))
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'CHAR', 'COMMA', 'DIV', 'DO', 'ELSE', 'EQUAL', 'FLOAT', 'FLOAT_CONSTANT', 'FOR', 'GE', 'GT', 'IDENTIFIER', 'IF', 'INT', 'INTEGER_CONSTANT', 'LBRACE', 'LBRACKET', 'LE', 'LPAREN', 'LT', 'MINUS', 'NOT', 'NOT_EQUAL', 'PLUS', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'TIMES', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_IDENTIFIER>_*[a-zA-Z][_a-zA-Z0-9]*)|(?P<t_NEWLINE>\\n+)|(?P<t_FLOAT_CONSTANT>[0-9]+\\.[0-9]+)|(?P<t_INTEGER_CONSTANT>[0-9]+)|(?P<t_MINUS>\\-)|(?P<t_LE><=)|(?P<t_RBRACE>\\})|(?P<t_GE>>=)|(?P<t_LPAREN>\\()|(?P<t_TIMES>\\*)|(?P<t_EQUAL>==)|(?P<t_RBRACKET>\\])|(?P<t_DIV>\\/)|(?P<t_LBRACKET>\\[)|(?P<t_NOT_EQUAL>!=)|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_PLUS>\\+)|(?P<t_COMMA>,)|(?P<t_LT><)|(?P<t_NOT>!)|(?P<t_ASSIGN>=)|(?P<t_SEMICOLON>;)|(?P<t_GT>>)', [None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_NEWLINE', 'NEWLINE'), (None, 'FLOAT_CONSTANT'), (None, 'INTEGER_CONSTANT'), (None, 'MINUS'), (None, 'LE'), (None, 'RBRACE'), (None, 'GE'), (None, 'LPAREN'), (None, 'TIMES'), (None, 'EQUAL'), (None, 'RBRACKET'), (None, 'DIV'), (None, 'LBRACKET'), (None, 'NOT_EQUAL'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'PLUS'), (None, 'COMMA'), (None, 'LT'), (None, 'NOT'), (None, 'ASSIGN'), (None, 'SEMICOLON'), (None, 'GT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -1,3 +1,7 @@
+import copy
+import hashlib
+from collections import OrderedDict
+
 import ply.yacc as yacc
 
 from lexer import Lexer, Coord
@@ -7,6 +11,17 @@ from sarac.core.rep.ast import *
 from sarac.core.error import Error
 
 
+def token_coord(p, n):
+    """
+    Builds the coordinate of the n-th symbol of a production, which must be a token
+    :param p: YaccProduction
+    :param n: int
+    :return: Coord
+    """
+    token = p.slice[n]
+    return Coord(token.lineno, token.column)
+
+
 class Parser(object):
     precedence = (
         ('left', 'EQUAL', 'NOT_EQUAL'),
@@ -15,24 +30,75 @@ class Parser(object):
         ('left', 'TIMES', 'DIV'),
     )
 
-    def __init__(self):
+    type_descriptors = {
+        'char': charTypeDescriptor,
+        'int': integerTypeDescriptor,
+        'float': floatTypeDescriptor,
+    }
+
+    def __init__(self, cache_size=0):
+        """
+        :param cache_size: int, how many error-free parse trees are kept by source digest, 0 disables the cache.
+        Worth it for tools that parse the same sources repeatedly, a single parse only pays for the extra copy
+        """
         self.error_count = 0
+        self.constants = {}  # Constant nodes of the current parse by lexeme, literals are shared
+        self.cache_size = cache_size
+        self.parse_cache = OrderedDict()  # Least recently used first
         self.lexer = Lexer()
-        self.lexer.build(optimize=False, debug=True)
+        # Tables are loaded from lextab.py and parsetab.py, delete them after changing the lexer or the grammar
+        self.lexer.build(optimize=1, lextab='sarac.core.front.lextab')
         self.tokens = self.lexer.tokens
-        self.parser = yacc.yacc(module=self, optimize=False, debug=True)
+        self.parser = yacc.yacc(module=self, optimize=1, debug=False, tabmodule='sarac.core.front.parsetab')
 
     def parse(self, input_text):
-        return self.parser.parse(input_text)
+        if self.cache_size == 0:
+            return self._parse(input_text)
+
+        key = hashlib.sha1(input_text).digest()
+        program = self.parse_cache.pop(key, None)
+        if program is not None:
+            self.error_count = 0
+            self.parse_cache[key] = program
+            # Callers annotate and rewrite the tree, the cached one must stay pristine
+            return copy.deepcopy(program)
+
+        errors = Error.errors
+        program = self._parse(input_text)
+        # Lexical errors are not syntax errors, a hit would not report them again
+        if program is not None and self.error_count == 0 and Error.errors == errors:
+            self.parse_cache[key] = copy.deepcopy(program)
+            if len(self.parse_cache) > self.cache_size:
+                self.parse_cache.popitem(last=False)
+        return program
+
+    def _parse(self, input_text):
+        self.error_count = 0
+        self.constants = {}
+        self.lexer.input(input_text)
+        return self.parser.parse(lexer=self.lexer)
+
+    def constant(self, lexeme, ctype):
+        """
+        Returns the Constant node of a literal, shared by all of its occurrences in the current parse
+        :param lexeme: str
+        :param ctype: TypeDescriptor
+        :return: Constant
+        """
+        constant = self.constants.get(lexeme)
+        if constant is None:
+            constant = Constant(lexeme, ctype)
+            self.constants[lexeme] = constant
+        return constant
 
     def p_translation_unit(self, p):
-        """translation_unit : external_declaration
-                            | translation_unit external_declaration"""
-        if len(p) == 3:
-            p[0] = p[1]
-            p[0].children.append(p[2])
-        else:
-            p[0] = TranslationUnitList([p[1]])
+        """translation_unit : external_declaration"""
+        p[0] = TranslationUnitList([p[1]])
+
+    def p_translation_unit_append(self, p):
+        """translation_unit : translation_unit external_declaration"""
+        p[1].children.append(p[2])
+        p[0] = p[1]
 
     def p_external_declaration(self, p):
         """external_declaration : function_definition
@@ -41,92 +107,85 @@ class Parser(object):
 
     def p_function_definition(self, p):
         """function_definition : type_specifier IDENTIFIER LPAREN parameters RPAREN compound_statement"""
-        identifier = Identifier(p[2][0])
-        identifier.coord = Coord(p[2][1], p[2][2])
+        identifier = Identifier(p[2])
+        identifier.coord = token_coord(p, 2)
         p[0] = FunctionDefinition(identifier, p[1], p[4], p[6])
 
 
     def p_parameters(self, p):
-        """parameters : parameter_list
-                      | 
-        """
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = ParameterList([])
+        """parameters : parameter_list"""
+        p[0] = p[1]
 
-    def p_parameter_list(self, p):
-        """parameter_list : parameter_list COMMA type_specifier IDENTIFIER
-                          | type_specifier IDENTIFIER
-        """
+    def p_parameters_empty(self, p):
+        """parameters :"""
+        p[0] = ParameterList([])
 
-        if len(p) == 5:
-            identifier = Identifier(p[4][0], p[3])
-            identifier.coord = Coord(p[4][1], p[4][2])
-            declaration = Declaration(p[3], identifier)
-            declaration.coord = identifier.coord
-            p[0] = p[1]
-            p[0].children.append(declaration)
-        else:
-            identifier = Identifier(p[2][0], p[1])
-            identifier.coord = Coord(p[2][1], p[2][2])
-            declaration = Declaration(p[1], identifier)
-            declaration.coord = identifier.coord
-            p[0] = ParameterList([declaration])
+    def p_parameter_list(self, p):
+        """parameter_list : type_specifier IDENTIFIER"""
+        identifier = Identifier(p[2], p[1])
+        identifier.coord = token_coord(p, 2)
+        declaration = Declaration(p[1], identifier)
+        declaration.coord = identifier.coord
+        p[0] = ParameterList([declaration])
+
+    def p_parameter_list_append(self, p):
+        """parameter_list : parameter_list COMMA type_specifier IDENTIFIER"""
+        identifier = Identifier(p[4], p[3])
+        identifier.coord = token_coord(p, 4)
+        declaration = Declaration(p[3], identifier)
+        declaration.coord = identifier.coord
+        p[1].children.append(declaration)
+        p[0] = p[1]
 
     def p_declaration_list(self, p):
-        """declarations : declarations declaration
-                        |
-        """
-        if len(p) == 3:
-            p[0] = p[1]
-            p[0].children.append(p[2])
-        else:
-            p[0] = DeclarationList([])
+        """declarations :"""
+        p[0] = DeclarationList([])
+
+    def p_declaration_list_append(self, p):
+        """declarations : declarations declaration"""
+        p[1].children.append(p[2])
+        p[0] = p[1]
 
     def p_declaration(self, p):
         """declaration : type_specifier IDENTIFIER SEMICOLON"""
-        identifier = Identifier(p[2][0], p[1])
-        identifier.coord = Coord(p[2][1], p[2][2])
+        identifier = Identifier(p[2], p[1])
+        identifier.coord = token_coord(p, 2)
         p[0] = Declaration(p[1], identifier)
         p[0].coord = identifier.coord
 
     def p_statement_list(self, p):
-        """statements : statements statement
-                      |
-        """
-        if len(p) == 3:
-            p[0] = p[1]
-            p[0].children.append(p[2])
-        else:
-            p[0] = StatementList([])
+        """statements :"""
+        p[0] = StatementList([])
+
+    def p_statement_list_append(self, p):
+        """statements : statements statement"""
+        p[1].children.append(p[2])
+        p[0] = p[1]
 
     def p_control_if(self, p):
-        """statement : IF LPAREN expression RPAREN statement
-                     | IF LPAREN expression RPAREN statement ELSE statement
-        """
-        if len(p) == 6:
-            p[0] = If(p[3], p[5])
-        else:
-            p[0] = If(p[3], p[5], p[7])
+        """statement : IF LPAREN expression RPAREN statement"""
+        p[0] = If(p[3], p[5])
+
+    def p_control_if_else(self, p):
+        """statement : IF LPAREN expression RPAREN statement ELSE statement"""
+        p[0] = If(p[3], p[5], p[7])
 
     def p_while_loop(self, p):
         """statement : WHILE LPAREN expression RPAREN statement"""
         p[0] = While(p[2], p[3])
 
     def p_for_loop(self, p):
-        """statement : FOR LPAREN expression_statement expression_statement RPAREN statement
-                     | FOR LPAREN expression_statement expression_statement expression RPAREN statement"""
+        """statement : FOR LPAREN expression_statement expression_statement RPAREN statement"""
+        p[0] = For(p[3], p[4], None, p[6])
 
-        if len(p) == 7:
-            p[0] = For(p[3], p[4], None, p[6])
-        else:
-            p[0] = For(p[3], p[4], p[5], p[7])
+    def p_for_loop_after(self, p):
+        """statement : FOR LPAREN expression_statement expression_statement expression RPAREN statement"""
+        p[0] = For(p[3], p[4], p[5], p[7])
 
     def p_assignment(self, p):
         """statement : IDENTIFIER ASSIGN expression SEMICOLON"""
-        identifier = Identifier(p[1][0])
-        identifier.coord = Coord(p[1][1], p[1][2])
+        identifier = Identifier(p[1])
+        identifier.coord = token_coord(p, 1)
         p[0] = Assignment(identifier, p[3])
         p[0].coord = identifier.coord
 
@@ -143,16 +202,19 @@ class Parser(object):
         p[0] = CompoundStatement(p[2], p[3])
 
     def p_expression_semi(self, p):
-        """expression_statement : SEMICOLON
-                                | expression SEMICOLON"""
-        if len(p) == 2:
-            p[0] = None
-        else:
-            p[0] = p[1]
+        """expression_statement : expression SEMICOLON"""
+        p[0] = p[1]
+
+    def p_expression_semi_empty(self, p):
+        """expression_statement : SEMICOLON"""
+        p[0] = None
+
+    def p_expression(self, p):
+        """expression : unary_expression"""
+        p[0] = p[1]
 
     def p_binary_expression(self, p):
-        """expression : unary_expression
-                      | expression LT expression
+        """expression : expression LT expression
                       | expression LE expression
                       | expression GT expression
                       | expression GE expression
@@ -160,60 +222,53 @@ class Parser(object):
                       | expression MINUS expression
                       | expression TIMES expression 
                       | expression DIV expression"""
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            binary_op = BinaryOperator(p[2][0], p[1], p[3])
-            binary_op.coord = Coord(p[2][1], p[2][2])
-            p[0] = binary_op
+        binary_op = BinaryOperator(p[2], p[1], p[3])
+        binary_op.coord = token_coord(p, 2)
+        p[0] = binary_op
 
     def p_unary_expression(self, p):
-        """unary_expression : primary_expression
-                            | unary_operator unary_expression"""
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = UnaryOperator(p[1], p[2])
+        """unary_expression : primary_expression"""
+        p[0] = p[1]
+
+    def p_unary_expression_operator(self, p):
+        """unary_expression : unary_operator unary_expression"""
+        p[0] = UnaryOperator(p[1], p[2])
 
     def p_expression_paren(self, p):
         """primary_expression : LPAREN expression RPAREN"""
         p[0] = p[2]
 
-    def p_primary_expression_number(self, p):
-        """primary_expression : NUMBER"""
-        if '.' in p[1][0]:
-            p[0] = Constant(p[1][0], floatTypeDescriptor)
-        else:
-            p[0] = Constant(p[1][0], integerTypeDescriptor)
+    def p_primary_expression_integer(self, p):
+        """primary_expression : INTEGER_CONSTANT"""
+        p[0] = self.constant(p[1], integerTypeDescriptor)
+
+    def p_primary_expression_float(self, p):
+        """primary_expression : FLOAT_CONSTANT"""
+        p[0] = self.constant(p[1], floatTypeDescriptor)
 
     def p_primary_expression_ref(self, p):
         """primary_expression : IDENTIFIER"""
-        reference = Reference(p[1][0])
-        reference.coord = Coord(p[1][1], p[1][2])
+        reference = Reference(p[1])
+        reference.coord = token_coord(p, 1)
         p[0] = reference
 
     def p_unary_operator(self, p):
         """unary_operator : NOT
                           | MINUS
                           | PLUS"""
-        p[0] = p[1][0]
+        p[0] = p[1]
 
     def p_type_specifier(self, p):
         """type_specifier : CHAR
                           | INT
                           | FLOAT"""
-        if p[1][0] == "char":
-            p[0] = charTypeDescriptor
-        elif p[1][0] == "int":
-            p[0] = integerTypeDescriptor
-        else:
-            p[0] = floatTypeDescriptor
+        p[0] = self.type_descriptors[p[1]]
 
     def p_error(self, p):
         self.error_count += 1
         if p is not None:
-            Error.syntax_error("unexpected token '%s'" % p.value[0],
-                               p.value[1], p.value[2])
+            Error.syntax_error("unexpected token '%s'" % p.value,
+                               p.lineno, p.column)
 
             while True:
                 token = self.parser.token()
@@ -226,3 +281,21 @@ class Parser(object):
             return token
         else:
             Error.syntax_error("unexpected end-of-file")
+
+
+_parser = None
+
+
+def get_parser():
+    """
+    Returns the process-wide parser, building it on first use. Parsers keep no state between parses
+    :return: Parser
+    """
+    global _parser
+    if _parser is None:
+        _parser = Parser()
+    return _parser
+
+
+def parse(input_text):
+    return get_parser().parse(input_text)
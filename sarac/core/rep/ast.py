@@ -1,7 +1,13 @@
+# Children of the leaves, shared by all of them since leaves never get children
+NO_CHILDREN = ()
+
+
 class Node(object):
-    def __init__(self):
+    __slots__ = ('coord', 'children')
+
+    def __init__(self, children=NO_CHILDREN):
         self.coord = None
-        self.children = []
+        self.children = children
 
     def __iter__(self):
         for child in self.children:
@@ -14,22 +20,37 @@ class Node(object):
         for child in self.children:
             child.accept(visitor) if child is not None else None
 
+    def iter_preorder(self):
+        """
+        Yields the subtree's nodes in pre-order, using an explicit stack instead of recursion
+        :return: generator of Node
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if child is not None)
+
 
 class Program(object):
+    __slots__ = ('children',)
+
     def __init__(self, statements):
         self.children = [statements]
 
 
 class TranslationUnitList(Node):
+    __slots__ = ('names',)
+
     def __init__(self, units):
-        super(TranslationUnitList, self).__init__()
-        self.children = units
+        super(TranslationUnitList, self).__init__(units)
 
 
 class FunctionDefinition(Node):
+    __slots__ = ('return_type',)
+
     def __init__(self, name, type, parameters, body):
-        super(FunctionDefinition, self).__init__()
-        self.children = [name, parameters, body]
+        super(FunctionDefinition, self).__init__([name, parameters, body])
         self.return_type = type
         # self.type = type
         # self.parameters = parameters
@@ -37,34 +58,39 @@ class FunctionDefinition(Node):
 
 
 class ParameterList(Node):
+    __slots__ = ()
+
     def __init__(self, parameters):
-        super(ParameterList, self).__init__()
-        self.children = parameters
+        super(ParameterList, self).__init__(parameters)
 
 
 class CompoundStatement(Node):
+    __slots__ = ('names',)
+
     def __init__(self, declaration_list, statement_list):
-        super(CompoundStatement, self).__init__()
-        self.children = [declaration_list, statement_list]
+        super(CompoundStatement, self).__init__([declaration_list, statement_list])
         self.names = {}
 
 
 class StatementList(Node):
+    __slots__ = ()
+
     def __init__(self, statements):
-        super(StatementList, self).__init__()
-        self.children = statements
+        super(StatementList, self).__init__(statements)
 
 
 class While(Node):
+    __slots__ = ()
+
     def __init__(self, expression, statement):
-        super(While, self).__init__()
-        self.children = [expression, statement]
+        super(While, self).__init__([expression, statement])
 
 
 class For(Node):
+    __slots__ = ()
+
     def __init__(self, init, condition, after, statement):
-        super(For, self).__init__()
-        self.children = [init, condition, after, statement]
+        super(For, self).__init__([init, condition, after, statement])
         # self.init = init
         # self.condition = condition
         # self.after = after
@@ -72,9 +98,10 @@ class For(Node):
 
 
 class If(Node):
+    __slots__ = ()
+
     def __init__(self, expression, then_part, else_part=None):
-        super(If, self).__init__()
-        self.children = [expression, then_part, else_part]
+        super(If, self).__init__([expression, then_part, else_part])
 
         # self.expression = expression
         # self.then_part = then_part
@@ -82,59 +109,65 @@ class If(Node):
 
 
 class Declaration(Node):
+    __slots__ = ('type',)
+
     def __init__(self, id_type, identifier):
-        super(Declaration, self).__init__()
-        self.children = [identifier]
+        super(Declaration, self).__init__([identifier])
         self.type = id_type
         # self.identifier = identifier
         # self.identifier.type = id_type
 
 
 class DeclarationList(Node):
+    __slots__ = ()
+
     def __init__(self, declarations):
-        super(DeclarationList, self).__init__()
-        self.children = declarations
+        super(DeclarationList, self).__init__(declarations)
 
 
 class Assignment(Node):
+    __slots__ = ('type',)
+
     def __init__(self, identifier, expression):
-        super(Assignment, self).__init__()
+        super(Assignment, self).__init__([identifier, expression])
         self.type = None
-        self.children = [identifier, expression]
 
 
 class Expression(Node):
-    def __init__(self):
-        super(Expression, self).__init__()
+    __slots__ = ('name', 'type')
+
+    def __init__(self, children=NO_CHILDREN):
+        super(Expression, self).__init__(children)
         self.name = None
         self.type = None
 
 
 class UnaryOperator(Expression):
+    __slots__ = ('op',)
     UNARY_OP = 1
 
     def __init__(self, operator, expression):
-        super(UnaryOperator, self).__init__()
+        super(UnaryOperator, self).__init__([expression])
         self.op = operator
-        self.children = [expression]
 
     def __repr__(self):
         return "%s(%s)" % (self.op, str(self.children[0]))
 
 
 class BinaryOperator(Expression):
+    __slots__ = ('op',)
     BINARY_OP = 1
 
     def __init__(self, operator, left_expression, right_expression):
-        super(BinaryOperator, self).__init__()
+        super(BinaryOperator, self).__init__([left_expression, right_expression])
         self.op = operator
-        self.children = [left_expression, right_expression]
 
     def __repr__(self):
         return "%s %s %s" % (str(self.children[0]), self.op, str(self.children))
 
 
 class Constant(Expression):
+    __slots__ = ('value',)
     CONSTANT = 2
 
     def __init__(self, value, ctype):
@@ -147,6 +180,7 @@ class Constant(Expression):
 
 
 class Reference(Expression):
+    __slots__ = ('attributes',)
     REFERENCE = 3
 
     def __init__(self, name):
@@ -159,6 +193,7 @@ class Reference(Expression):
 
 
 class Identifier(Node):
+    __slots__ = ('name', 'type', 'value', 'attributes')
     IDENTIFIER = 3
 
     def __init__(self, name, id_type=None, value=None):
@@ -1,22 +1,39 @@
 class Attributes(object):
+    __slots__ = ('name', 'type')
+
     def __init__(self):
         self.name = None
         self.type = None
 
 
 class FunctionAttributes(Attributes):
+    __slots__ = ('_parameters', '_parameters_repr')
+
     def __init__(self):
         super(FunctionAttributes, self).__init__()
-        self.parameters = None
+        self._parameters = None
+        self._parameters_repr = None
+
+    @property
+    def parameters(self):
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, parameters):
+        self._parameters = parameters
+        self._parameters_repr = None
 
     def __repr__(self):
-        return "<FunctionAttributes, {} {}({})>".format(self.type,
-                                                        self.name,
-                                                        [str(decl.children[0].type) + " " + decl.children[0].name \
-                                                         for decl in self.parameters.children])
+        # The parameters are rendered once, they are not changed after the definition is visited
+        if self._parameters_repr is None:
+            self._parameters_repr = str([str(decl.children[0].type) + " " + decl.children[0].name
+                                         for decl in self._parameters.children])
+        return "<FunctionAttributes, %s %s(%s)>" % (self.type, self.name, self._parameters_repr)
 
 
 class VariableAttributes(Attributes):
+    __slots__ = ('offset',)
+
     def __init__(self):
         super(VariableAttributes, self).__init__()
         self.offset = None
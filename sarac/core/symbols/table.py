@@ -6,34 +6,61 @@ class SymbolTable(object):
         self.depth = 0
         self.global_scope = {}
         self.scope_stack = []
+        # Innermost visible binding of every name, restored from undo_stack when its scope closes
+        self.bindings = {}
+        self.undo_stack = []
+        # Scope dicts outlive their scope on the AST, only the undo lists can be reused
+        self.free_undo_lists = []
 
     def open_scope(self, scope=None):
+        """
+        Pushes a scope, a new one unless given
+        :param scope: dict or None
+        :return: dict, the opened scope
+        """
         if scope is None:
-            self.scope_stack.append({})
-        else:
-            self.scope_stack.append(scope)
+            scope = {}
+        self.scope_stack.append(scope)
+        self.undo_stack.append(self.free_undo_lists.pop() if self.free_undo_lists else [])
+        for name, attributes in scope.iteritems():
+            self._bind(name, attributes)
+        return scope
 
     def close_scope(self):
         assert len(self.scope_stack) > 0
         self.scope_stack.pop()
+        undo = self.undo_stack.pop()
+        for name, previous in reversed(undo):
+            if previous is None:
+                del self.bindings[name]
+            else:
+                self.bindings[name] = previous
+        del undo[:]
+        self.free_undo_lists.append(undo)
 
     def current_scope(self):
         assert len(self.scope_stack) > 0
         return self.scope_stack[-1]
 
     def put(self, symbol, attributes):
-        check_attr = self.lookup(symbol.name)
-        if symbol.name in self.scope_stack[-1]:
+        scope = self.scope_stack[-1]
+        if symbol.name in scope:
             Error.name_error("\"%s\" is already defined" % symbol.name, symbol.coord.line, symbol.coord.column)
-        elif check_attr is not None and type(check_attr) != type(attributes):
+            return
+
+        # Only names that are free in the current scope need the walk through the enclosing ones
+        check_attr = self.lookup(symbol.name)
+        if check_attr is not None and type(check_attr) is not type(attributes):
             Error.name_error("\"%s\" redeclared as different kind of symbol" % symbol.name,
                              symbol.coord.line,
                              symbol.coord.column)
         else:
-            self.scope_stack[-1][symbol.name] = attributes
+            scope[symbol.name] = attributes
+            self._bind(symbol.name, attributes)
 
     def lookup(self, name):
-        for scope in reversed(self.scope_stack):
-            if name in scope:
-                return scope[name]
-        return None
+        return self.bindings.get(name)
+
+    def _bind(self, name, attributes):
+        self.undo_stack[-1].append((name, self.bindings.get(name)))
+        self.bindings[name] = attributes
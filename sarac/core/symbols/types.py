@@ -4,52 +4,82 @@ CHAR_SIZE = 1
 INTEGER_SIZE = 4
 FLOAT_SIZE = 8
 
+# Small integer identifying each descriptor, indexes the generalization table
+CHAR_KIND = 0
+INTEGER_KIND = 1
+FLOAT_KIND = 2
+
 
 class TypeDescriptor(object):
+    # kind is a class attribute of each descriptor, not a slot
+    __slots__ = ('size',)
+
     def __init__(self, size):
         self.size = size
 
 
 class CharTypeDescriptor(TypeDescriptor):
+    __slots__ = ()
+    kind = CHAR_KIND
+
     def __init__(self):
         super(CharTypeDescriptor, self).__init__(CHAR_SIZE)
 
     def __repr__(self):
         return "char"
 
+    def __reduce__(self):
+        # Unpickles (and copies) to the module singleton
+        return "charTypeDescriptor"
+
 
 class IntegerTypeDescriptor(TypeDescriptor):
+    __slots__ = ()
+    kind = INTEGER_KIND
+
     def __init__(self):
         super(IntegerTypeDescriptor, self).__init__(INTEGER_SIZE)
 
     def __repr__(self):
         return "int"
 
+    def __reduce__(self):
+        return "integerTypeDescriptor"
+
 
 class FloatTypeDescriptor(TypeDescriptor):
+    __slots__ = ()
+    kind = FLOAT_KIND
+
     def __init__(self):
         super(FloatTypeDescriptor, self).__init__(FLOAT_SIZE)
 
     def __repr__(self):
         return "float"
 
+    def __reduce__(self):
+        return "floatTypeDescriptor"
+
 
 def is_numeric_type(ttype):
-    if ttype == integerTypeDescriptor or ttype == floatTypeDescriptor or ttype == charTypeDescriptor:
-        return True
-    return False
+    return ttype is integerTypeDescriptor or ttype is floatTypeDescriptor or ttype is charTypeDescriptor
 
 
 def generalize_type(type1, type2):
-    if not is_numeric_type(type1) or not is_numeric_type(type2):
+    # Untyped operands, e.g. unary operators, cannot be generalized
+    if type1 is None or type2 is None:
         return None
-    if type1 == floatTypeDescriptor or type2 == floatTypeDescriptor:
-        return floatTypeDescriptor
-    elif type1 == integerTypeDescriptor or type2 == integerTypeDescriptor:
-        return integerTypeDescriptor
-    return charTypeDescriptor
+    return _GENERALIZED[type1.kind << 2 | type2.kind]
 
 
 charTypeDescriptor = CharTypeDescriptor()
 integerTypeDescriptor = IntegerTypeDescriptor()
 floatTypeDescriptor = FloatTypeDescriptor()
+
+# _GENERALIZED[kind1 << 2 | kind2] is the type both operands are converted to, kinds take two bits
+_GENERALIZED = (
+    charTypeDescriptor, integerTypeDescriptor, floatTypeDescriptor, None,
+    integerTypeDescriptor, integerTypeDescriptor, floatTypeDescriptor, None,
+    floatTypeDescriptor, floatTypeDescriptor, floatTypeDescriptor, None,
+    None, None, None, None,
+)
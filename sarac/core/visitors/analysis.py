@@ -0,0 +1,36 @@
+from sarac.core.rep.ast import Expression
+from sarac.core.visitors.symboltable import BuildSymbolTableVisitor
+from sarac.core.visitors.semantics import SEMANTIC_CHECKS
+from sarac.core.visitors.optimizer import BuildDAGVisitor
+
+
+class AnalysisVisitor(BuildSymbolTableVisitor):
+    """
+    Builds the symbol table, checks the semantics and optimizes the expressions of a program in a single traversal
+    """
+    def __init__(self, optimize=True):
+        super(AnalysisVisitor, self).__init__()
+        self.optimize = optimize
+        self.expression_depth = 0
+
+    def visit(self, node):
+        """
+        Binds the node's symbols, visits its children and then checks it
+        :param node: Node
+        :return: None
+        """
+        is_expression = isinstance(node, Expression)
+        if is_expression:
+            self.expression_depth += 1
+
+        super(AnalysisVisitor, self).visit(node)
+
+        check = SEMANTIC_CHECKS.get(type(node))
+        if check is not None:
+            check(node)
+
+        if is_expression:
+            self.expression_depth -= 1
+            # Outermost expressions are turned into DAGs, like OptimizerVisitor does
+            if self.optimize and self.expression_depth == 0:
+                node.accept(BuildDAGVisitor())
@@ -1,5 +1,8 @@
 from sarac.core.rep.ast import Expression, Constant, Reference, UnaryOperator, BinaryOperator
 
+# Bump whenever the optimizations change, cached optimized programs depend on it
+OPTIMIZER_REV = '1'
+
 
 class OptimizerVisitor(object):
     def visit(self, node):
@@ -8,60 +11,48 @@ class OptimizerVisitor(object):
         :param node: Node
         :return: None
         """
-        if isinstance(node, Expression):
-            build_dag = BuildDAGVisitor()
-            node.accept(build_dag)
-            return
-
-        node.accept_children(self)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Expression):
+                build_dag = BuildDAGVisitor()
+                node.accept(build_dag)
+            else:
+                stack.extend(child for child in reversed(node.children) if child is not None)
 
 
 class BuildDAGVisitor(object):
     def __init__(self):
         self.exprs = {}
+        self.keys = {}  # Structural key of each visited node, by id
 
     def visit(self, node):
         """
-        Receives an expression node and transform it's children to a DAG representation
+        Receives an expression node and transform it's children to a DAG representation.
+        Operators are keyed by their operator and the identity of their already shared children,
+        so keys are built once per node instead of re-rendering whole subtrees
         :param node: Expression
         :return: None
         """
-        if isinstance(node, Constant):
-            node_repr = str(node)
-            if node_repr not in self.exprs:
-                self.exprs[node_repr] = node
+        node_type = type(node)
+        if node_type is Constant:
+            key = (Constant, node.value)
 
-        if isinstance(node, Reference):
-            if node.name not in self.exprs:
-                self.exprs[node.name] = node
+        elif node_type is Reference:
+            key = (Reference, node.name)
 
-        if isinstance(node, BinaryOperator):
+        elif node_type is BinaryOperator or node_type is UnaryOperator:
             node.accept_children(self)
 
-            node_repr = str(node)
-            if node_repr not in self.exprs:
-                self.exprs[node_repr] = node
-
-            left_node_repr = str(node.children[0])
-            right_node_repr = str(node.children[1])
+            children = node.children
+            for i, child in enumerate(children):
+                children[i] = self.exprs[self.keys[id(child)]]
 
-            if left_node_repr in self.exprs:
-                node.children[0] = self.exprs[left_node_repr]
-            else:
-                self.exprs[left_node_repr] = node.children[0]
+            key = (node_type, node.op) + tuple(id(child) for child in children)
 
-            if right_node_repr in self.exprs:
-                node.children[1] = self.exprs[right_node_repr]
-            else:
-                self.exprs[right_node_repr] = node.children[1]
-
-        if isinstance(node, UnaryOperator):
-            node.accept_children(self)
-
-            node_repr = str(node)
-            if node_repr not in self.exprs:
-                self.exprs[node_repr] = node
+        else:
+            return
 
-            expr_repr = str(node.children[0])
-            if expr_repr in self.exprs:
-                self.exprs[expr_repr] = node.children[0]
+        self.keys[id(node)] = key
+        if key not in self.exprs:
+            self.exprs[key] = node
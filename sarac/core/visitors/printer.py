@@ -4,59 +4,110 @@ from sarac.core.rep.ast import *
 class PrintASTVisitor(object):
     def __init__(self):
         self.spaces = 0
+        self.output = []
+        self.indents = [' ']  # Printing an empty indent used to separate it from the text with a space
+        self._dispatch = {
+            TranslationUnitList: self._visit_translation_unit_list,
+            Declaration: self._visit_declaration,
+            DeclarationList: self._visit_declaration_list,
+            ParameterList: self._visit_parameter_list,
+            StatementList: self._visit_statement_list,
+            FunctionDefinition: self._visit_function_definition,
+            If: self._visit_if,
+            While: self._visit_while,
+            For: self._visit_for,
+            CompoundStatement: self._visit_compound_statement,
+            Assignment: self._visit_assignment,
+            UnaryOperator: self._visit_unary_operator,
+            BinaryOperator: self._visit_binary_operator,
+            Identifier: self._visit_identifier,
+            Reference: self._visit_reference,
+            Constant: self._visit_constant,
+        }
 
     def visit(self, node):
-        if isinstance(node, TranslationUnitList):
-            print '* Visiting a translation unit list'
-            node.accept_children(self)
-        if isinstance(node, Declaration):
-            self.spaces += 1
-            print '* Visiting a declaration'
-            node.accept_children(self)
-            self.spaces -= 1
-        elif isinstance(node, DeclarationList):
-            self.spaces += 1
-            print '* Visiting declarations'
-            node.accept_children(self)
-            self.spaces -= 1
-        elif isinstance(node, ParameterList):
-            self.spaces += 1
-            print '* Visiting parameters'
-            node.accept_children(self)
-            self.spaces -= 1
-        elif isinstance(node, StatementList):
-            print '* Visiting statements'
-            node.accept_children(self)
-        elif isinstance(node, FunctionDefinition):
-            print '* Visiting function definition'
-            node.accept_children(self)
-        elif isinstance(node, If):
-            print '* Visiting if'
-            node.accept_children(self)
-        elif isinstance(node, While):
-            print '* Visiting while'
-            node.accept_children(self)
-        elif isinstance(node, For):
-            print '* Visiting for'
-            node.accept_children(self)
-        elif isinstance(node, CompoundStatement):
-            print '* Visiting a compound statement'
-            print 'Symbols: ', node.names
-            node.accept_children(self)
-        elif isinstance(node, Assignment):
-            self.spaces += 1
-            print '* Visiting an assignment'
-            node.accept_children(self)
-            self.spaces -= 1
-        elif isinstance(node, UnaryOperator):
-            print self.spaces * '\t', 'Visiting an unary operator', node.op
-            node.accept_children(self)
-        elif isinstance(node, BinaryOperator):
-            print self.spaces * '\t', 'Visiting a binary operator: ', node.op
-            node.accept_children(self)
-        elif isinstance(node, Identifier):
-            print self.spaces * '\t', "Visiting an identifier: ", node.name
-        elif isinstance(node, Reference):
-            print self.spaces * '\t', "Visiting a reference: ", node.name
-        elif isinstance(node, Constant):
-            print self.spaces * '\t', "Visiting a constant: ", node.value
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+
+    def get_output(self):
+        """
+        Returns the text of the visited nodes
+        :return: str
+        """
+        return ''.join(self.output)
+
+    def indent(self):
+        while len(self.indents) <= self.spaces:
+            self.indents.append(len(self.indents) * '\t')
+        return self.indents[self.spaces]
+
+    def _visit_translation_unit_list(self, node):
+        self.output.append('* Visiting a translation unit list\n')
+        node.accept_children(self)
+
+    def _visit_declaration(self, node):
+        self.spaces += 1
+        self.output.append('* Visiting a declaration\n')
+        node.accept_children(self)
+        self.spaces -= 1
+
+    def _visit_declaration_list(self, node):
+        self.spaces += 1
+        self.output.append('* Visiting declarations\n')
+        node.accept_children(self)
+        self.spaces -= 1
+
+    def _visit_parameter_list(self, node):
+        self.spaces += 1
+        self.output.append('* Visiting parameters\n')
+        node.accept_children(self)
+        self.spaces -= 1
+
+    def _visit_statement_list(self, node):
+        self.output.append('* Visiting statements\n')
+        node.accept_children(self)
+
+    def _visit_function_definition(self, node):
+        self.output.append('* Visiting function definition\n')
+        node.accept_children(self)
+
+    def _visit_if(self, node):
+        self.output.append('* Visiting if\n')
+        node.accept_children(self)
+
+    def _visit_while(self, node):
+        self.output.append('* Visiting while\n')
+        node.accept_children(self)
+
+    def _visit_for(self, node):
+        self.output.append('* Visiting for\n')
+        node.accept_children(self)
+
+    def _visit_compound_statement(self, node):
+        self.output.append('* Visiting a compound statement\n')
+        self.output.append('Symbols:  %s\n' % (node.names,))
+        node.accept_children(self)
+
+    def _visit_assignment(self, node):
+        self.spaces += 1
+        self.output.append('* Visiting an assignment\n')
+        node.accept_children(self)
+        self.spaces -= 1
+
+    def _visit_unary_operator(self, node):
+        self.output.append('%sVisiting an unary operator %s\n' % (self.indent(), node.op))
+        node.accept_children(self)
+
+    def _visit_binary_operator(self, node):
+        self.output.append('%sVisiting a binary operator:  %s\n' % (self.indent(), node.op))
+        node.accept_children(self)
+
+    def _visit_identifier(self, node):
+        self.output.append("%sVisiting an identifier:  %s\n" % (self.indent(), node.name))
+
+    def _visit_reference(self, node):
+        self.output.append("%sVisiting a reference:  %s\n" % (self.indent(), node.name))
+
+    def _visit_constant(self, node):
+        self.output.append("%sVisiting a constant:  %s\n" % (self.indent(), node.value))
@@ -1,33 +1,101 @@
-from sarac.core.rep.ast import Reference, BinaryOperator, Assignment
+from sarac.core.rep.ast import Reference, BinaryOperator, Assignment, Constant
 from sarac.core.symbols.attributes import VariableAttributes
 from sarac.core.symbols.types import generalize_type
 from sarac.core.error import Error
 
 
 class SemanticsVisitor(object):
+    def __init__(self):
+        self._dispatch = {
+            Reference: self._visit_reference,
+            BinaryOperator: self._visit_binary_operator,
+            Assignment: self._visit_assignment,
+            Constant: self._visit_constant,
+        }
+
     def visit(self, node):
-        if isinstance(node, Reference):
-            if node.attributes is not None and not is_data_object(node):
-                Error.type_error("\"%s\" does not name a data object" % node.name, node.coord.line, node.coord.column)
+        """
+        Checks the subtree rooted at node with an explicit stack instead of recursing through accept.
+        Nodes checked after their children are pushed back with a POST marker below them
+        :param node: Node
+        :return: None
+        """
+        stack = [(node, PRE)]
+        # Bound once, the loop runs for every node of the program
+        pop = stack.pop
+        get_handler = self._dispatch.get
+        checks = SEMANTIC_CHECKS
+        while stack:
+            node, phase = pop()
+            if phase is POST:
+                checks[type(node)](node)
+                continue
+
+            handler = get_handler(type(node))
+            if handler is not None:
+                handler(node, stack)
+            else:
+                push_children(node, stack)
+
+    def _visit_constant(self, node, stack):
+        pass  # Constants are leaves and are typed by the parser
+
+    def _visit_reference(self, node, stack):
+        check_reference(node)
+
+    def _visit_binary_operator(self, node, stack):
+        stack.append((node, POST))
+        push_children(node, stack)
+
+    def _visit_assignment(self, node, stack):
+        stack.append((node, POST))
+        stack.append((node.children[1], PRE))
+
+
+# Traversal phases of the nodes on SemanticsVisitor's stack
+PRE = 0
+POST = 1
+
+
+def push_children(node, stack):
+    # Reversed, so the children are popped in source order
+    append = stack.append
+    for child in reversed(node.children):
+        if child is not None:
+            append((child, PRE))
+
+
+def check_reference(node):
+    if node.attributes is not None and not is_data_object(node):
+        Error.type_error("\"%s\" does not name a data object" % node.name, node.coord.line, node.coord.column)
+
 
-        if isinstance(node, BinaryOperator):
-            node.accept_children(self)
-            node.type = generalize_type(node.children[0].type, node.children[1].type)
+def check_binary_operator(node):
+    """
+    Types a binary operator whose operands were already checked
+    :param node: BinaryOperator
+    :return: None
+    """
+    left, right = node.children
+    node.type = generalize_type(left.type, right.type)
 
-            if node.type is None:
-                Error.type_error("invalid types", node.coord.line, node.coord.column)
+    if node.type is None:
+        Error.type_error("invalid types", node.coord.line, node.coord.column)
 
-            return
 
-        if isinstance(node, Assignment):
-            node.children[1].accept(self)
-            if node.children[0].type is not node.children[1].type:
-                Error.type_error("trying to assign different types", node.coord.line, node.coord.column)
+def check_assignment(node):
+    identifier, expression = node.children
+    if identifier.type is not expression.type:
+        Error.type_error("trying to assign different types", node.coord.line, node.coord.column)
 
-            return
 
-        node.accept_children(self)
+# Checks that only need the node's children to be checked first
+SEMANTIC_CHECKS = {
+    Reference: check_reference,
+    BinaryOperator: check_binary_operator,
+    Assignment: check_assignment,
+}
 
 
 def is_data_object(node):
-    return type(node.attributes) == VariableAttributes
+    return type(node.attributes) is VariableAttributes
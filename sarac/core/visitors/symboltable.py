@@ -1,7 +1,9 @@
+import sys
+
 from sarac.core.symbols.table import SymbolTable
 from sarac.core.symbols.attributes import FunctionAttributes, VariableAttributes
 from sarac.core.rep.ast import TranslationUnitList, FunctionDefinition,\
-    CompoundStatement, Declaration, Assignment, Reference
+    CompoundStatement, Declaration, Assignment, Reference, Constant
 from sarac.core.error import Error
 
 
@@ -10,65 +12,103 @@ class BuildSymbolTableVisitor(object):
         self.symbol_table = SymbolTable()
         self.symbol_table.open_scope(self.symbol_table.global_scope)
         self.offset = 0  # Offsets are treated as indexes to facilitate target generation
+        self._dispatch = {
+            TranslationUnitList: self._visit_translation_unit_list,
+            FunctionDefinition: self._visit_function_definition,
+            CompoundStatement: self._visit_compound_statement,
+            Declaration: self._visit_declaration,
+            Assignment: self._visit_assignment,
+            Reference: self._visit_reference,
+            Constant: self._visit_constant,
+        }
 
     def visit(self, node):
-        if isinstance(node, FunctionDefinition):
-            attributes = FunctionAttributes()
-            attributes.type = node.return_type
-            attributes.name = node.children[0].name
-            attributes.parameters = node.children[1]
-            self.symbol_table.put(node.children[0], attributes)
-            node.children[0].attributes = attributes
-            self.offset = 0  # Reset offset
-            self.symbol_table.open_scope()
-            node.children[1].accept_children(self)
-            node.children[2].accept_children(self)
-            node.children[2].names = self.symbol_table.current_scope()
-            self.symbol_table.close_scope()
-            return
-
-        elif isinstance(node, CompoundStatement):
-            self.symbol_table.open_scope()
-
-        elif isinstance(node, Declaration):
-            attributes = VariableAttributes()
-            attributes.type = node.type
-            attributes.name = node.children[0].name
-            attributes.offset = self.offset
-            self.offset += 1
-            self.symbol_table.put(node.children[0], attributes)
-
-        elif isinstance(node, Assignment):
-            attributes = self.symbol_table.lookup(node.children[0].name)
-            node.children[0].attributes = attributes
-            node.children[0].type = attributes.type
-
-        elif isinstance(node, Reference):
-            attributes = self.symbol_table.lookup(node.name)
-            if attributes is None:
-                Error.name_error("undeclared symbol \"%s\"" % node.name, node.coord.line, node.coord.column)
-            else:
-                node.type = attributes.type
-                node.attributes = attributes
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+        else:
+            node.accept_children(self)
+
+    def _visit_translation_unit_list(self, node):
+        node.accept_children(self)
+        node.names = self.symbol_table.global_scope
 
+    def _visit_function_definition(self, node):
+        identifier, parameters, body = node.children
+        symbol_table = self.symbol_table
+        attributes = FunctionAttributes()
+        attributes.type = node.return_type
+        attributes.name = identifier.name
+        attributes.parameters = parameters
+        symbol_table.put(identifier, attributes)
+        identifier.attributes = attributes
+        self.offset = 0  # Reset offset
+        scope = symbol_table.open_scope()
+        parameters.accept_children(self)
+        body.accept_children(self)
+        body.names = scope
+        symbol_table.close_scope()
+
+    def _visit_compound_statement(self, node):
+        symbol_table = self.symbol_table
+        node.names = symbol_table.open_scope()
         node.accept_children(self)
+        symbol_table.close_scope()
 
-        if isinstance(node, TranslationUnitList):
-            node.names = self.symbol_table.global_scope
+    def _visit_declaration(self, node):
+        identifier, = node.children
+        attributes = VariableAttributes()
+        attributes.type = node.type
+        attributes.name = identifier.name
+        attributes.offset = self.offset
+        self.offset += 1
+        self.symbol_table.put(identifier, attributes)
+        node.accept_children(self)
 
-        elif isinstance(node, CompoundStatement):
-            node.names = self.symbol_table.current_scope()
-            self.symbol_table.close_scope()
+    def _visit_assignment(self, node):
+        identifier = node.children[0]
+        attributes = self.symbol_table.lookup(identifier.name)
+        identifier.attributes = attributes
+        identifier.type = attributes.type
+        node.accept_children(self)
+
+    def _visit_constant(self, node):
+        pass  # Leaf, nothing to bind
+
+    def _visit_reference(self, node):
+        attributes = self.symbol_table.lookup(node.name)
+        if attributes is None:
+            Error.name_error("undeclared symbol \"%s\"" % node.name, node.coord.line, node.coord.column)
+        else:
+            node.type = attributes.type
+            node.attributes = attributes
 
 
 class SymbolTablePrinterVisitor(object):
+    def __init__(self):
+        self._dispatch = {
+            TranslationUnitList: self._visit_translation_unit_list,
+            CompoundStatement: self._visit_compound_statement,
+        }
+
     def visit(self, node):
-        if isinstance(node, TranslationUnitList):
-            print "global symbol table"
-            print "\t", node.names
+        """
+        Prints the scopes of the subtree with a single write
+        :param node: Node
+        :return: None
+        """
+        output = []
+        dispatch = self._dispatch
+        for descendant in node.iter_preorder():
+            handler = dispatch.get(type(descendant))
+            if handler is not None:
+                handler(descendant, output)
+        sys.stdout.write(''.join(output))
 
-        elif isinstance(node, CompoundStatement):
-            print "compound statement"
-            print "\t", node.names
+    def _visit_translation_unit_list(self, node, output):
+        output.append("global symbol table\n")
+        output.append("\t%s\n" % (node.names,))
 
-        node.accept_children(self)
+    def _visit_compound_statement(self, node, output):
+        output.append("compound statement\n")
+        output.append("\t%s\n" % (node.names,))